@@ -5,17 +5,26 @@ Enhanced Cloud Simulation with NE→SW movement pattern
 - Fixed boundary handling to prevent teleportation
 - Optimized performance with caching and vectorized operations
 """
+import logging
 import math
 import random
 import numpy as np
 import time
-from typing import List, Tuple, Optional, Dict, Any
-from functools import lru_cache
+from typing import List, Tuple, Optional, Dict, Any, Union
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from itertools import chain, islice
 import sim_config as CFG
 
+# Try to import Numba for the fused fleet kernel
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 print("Loading ultra-optimized cloud_simulation.py with NE→SW movement pattern")
 
 # Pre-compute constants for better performance
@@ -23,25 +32,38 @@ M_PER_FRAME = CFG.PHYSICS_TIMESTEP * (CFG.DOMAIN_SIZE_M / 1000.0)
 DEGREES_TO_RADIANS = math.pi / 180.0
 RADIANS_TO_DEGREES = 180.0 / math.pi
 
-# Cache for trigonometric calculations
-@lru_cache(maxsize=360)
-def cached_sin_cos(angle_deg: int) -> Tuple[float, float]:
-    """Cached trigonometric calculations for integer degrees."""
-    rad = angle_deg * DEGREES_TO_RADIANS
-    return math.sin(rad), math.cos(rad)
+# Lifecycle phase durations in frames (constant for the whole run)
+LIFECYCLE_GROWTH = getattr(CFG, 'CLOUD_GROWTH_FRAMES', 300)
+LIFECYCLE_STABLE = getattr(CFG, 'CLOUD_STABLE_FRAMES', 1800)
+LIFECYCLE_DECAY = getattr(CFG, 'CLOUD_DECAY_FRAMES', 300)
+MAX_AGE = LIFECYCLE_GROWTH + LIFECYCLE_STABLE + LIFECYCLE_DECAY
+# Guarded so zero-length phases import fine; t_growth still saturates at age 1
+_INV_GROWTH = np.float32(1.0 / max(LIFECYCLE_GROWTH, 1))
+_INV_DECAY = np.float32(1.0 / max(LIFECYCLE_DECAY, 1))
+
+# Trigonometric lookup tables for integer degrees 0..359
+_SIN_DEG = np.sin(np.arange(360) * DEGREES_TO_RADIANS)
+_COS_DEG = np.cos(np.arange(360) * DEGREES_TO_RADIANS)
+
+# STEP 4: NE→SW base velocity in metres per frame. CLOUD_DIRECTION (135°) and
+# BASE_WIND_SPEED are fixed for the run; each cloud only adds speed jitter
+_CLOUD_DIRECTION_DEG = int(getattr(CFG, 'CLOUD_DIRECTION', 135.0)) % 360
+_BASE_WIND_SPEED = getattr(CFG, 'BASE_WIND_SPEED', 4.0)
+_BASE_VX = _BASE_WIND_SPEED * float(_COS_DEG[_CLOUD_DIRECTION_DEG]) * M_PER_FRAME  # Negative (westward)
+_BASE_VY = _BASE_WIND_SPEED * float(_SIN_DEG[_CLOUD_DIRECTION_DEG]) * M_PER_FRAME  # Positive (southward)
+
+# Type-specific (width, height) ellipse factors
+_SHAPE_FACTORS: Dict[str, Tuple[float, float]] = {
+    "cirrus": (2.5, 0.4),        # Elongated for cirrus
+    "cumulonimbus": (1.2, 1.8),  # Taller for storm clouds
+}
 
-@lru_cache(maxsize=1000)
-def cached_ellipse_shape(radius_km: float, type_name: str, age_factor: float) -> Tuple[float, float, float, float]:
-    """Cache ellipse shape calculations based on radius, type, and age."""
+def ellipse_shape(radius_km: float, type_name: str, age_factor: float) -> Tuple[float, float, float, float]:
+    """Ellipse shape from radius, type, and age (a few multiplies, cheaper than a cache lookup)."""
     diameter_m = radius_km * 2000  # Convert km to m with visibility multiplier
     
-    # Type-specific shape adjustments
-    if type_name == "cirrus":
-        width_factor, height_factor = 2.5, 0.4  # Elongated for cirrus
-    elif type_name == "cumulonimbus":
-        width_factor, height_factor = 1.2, 1.8  # Taller for storm clouds
-    else:  # cumulus and others
-        width_factor, height_factor = 1.0, 1.0  # Circular
+    # Type-specific shape adjustments (cumulus and others are circular)
+    width_factor, height_factor = _SHAPE_FACTORS.get(type_name, (1.0, 1.0))
     
     # Age-based size adjustment
     base_width = diameter_m * width_factor * age_factor
@@ -82,9 +104,8 @@ class CloudTypePreset:
     speed_factor: float
     
     @classmethod
-    @lru_cache(maxsize=10)
     def from_config(cls, cloud_type: str) -> 'CloudTypePreset':
-        """Cached factory method for cloud type presets."""
+        """Build the preset for a cloud type from sim_config (use _PRESETS at runtime)."""
         preset = CFG.CLOUD_TYPES[cloud_type]
         r_lo, r_hi = preset["r_km"]
         return cls(
@@ -95,27 +116,107 @@ class CloudTypePreset:
             speed_factor=preset.get("speed_k", 1.0)
         )
 
-# STEP 1 & 2: Single spawn helper that places clouds in NE corner
-def _get_spawn_position_base(rng: np.random.Generator = None) -> tuple[float, float]:
-    """
-    Return an (x, y) point located just inside the North-East quadrant of the simulation box
-    so that, with CLOUD_DIRECTION = 135°, every cloud immediately drifts toward the South-West.
-    """
-    if rng is None:
-        rng = np.random.default_rng()
-    
-    d = CFG.DOMAIN_SIZE_M  # e.g. 50_000 m
-    
-    # Place clouds in North-East corner
-    x = rng.uniform(d * 0.85, d * 0.95)  # 85-95% of width (east edge)
-    y = rng.uniform(d * 0.05, d * 0.15)  # 5-15% of height (north edge)
-    
-    return x, y
+# All cloud type presets, built once at import
+_PRESETS: Dict[str, CloudTypePreset] = {name: CloudTypePreset.from_config(name) for name in CFG.CLOUD_TYPES}
+
+# Per-type lookup tables indexed by CloudFleet.type_id
+CLOUD_TYPE_NAMES: Tuple[str, ...] = tuple(_PRESETS.keys())
+CLOUD_TYPE_INDEX: Dict[str, int] = {name: i for i, name in enumerate(CLOUD_TYPE_NAMES)}
+_TYPE_R_KM_MAX = np.array([_PRESETS[n].r_km_max for n in CLOUD_TYPE_NAMES], dtype=np.float32)
+_TYPE_OPACITY_MAX = np.array([_PRESETS[n].opacity_max for n in CLOUD_TYPE_NAMES], dtype=np.float32)
+_TYPE_ALT_KM = np.array([_PRESETS[n].alt_km for n in CLOUD_TYPE_NAMES], dtype=np.float32)
+_TYPE_WIDTH_FACTOR = np.array([_SHAPE_FACTORS.get(n, (1.0, 1.0))[0] for n in CLOUD_TYPE_NAMES], dtype=np.float32)
+_TYPE_HEIGHT_FACTOR = np.array([_SHAPE_FACTORS.get(n, (1.0, 1.0))[1] for n in CLOUD_TYPE_NAMES], dtype=np.float32)
+
+# Placeholder passed to the fleet step when scattering is disabled
+_NO_ROLLS = np.empty(0, dtype=np.float32)
 
-# Optional advanced helper that just calls the base
-def _get_spawn_position_advanced(rng: np.random.Generator = None) -> tuple[float, float]:
-    """Advanced spawn helper - currently just calls base helper."""
-    return _get_spawn_position_base(rng)
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def step_fleet(x, y, prev_x, prev_y, vx, vy, r, opacity, age, type_id,
+                   split_fading, flag_for_split, alive, rolls, r_km_max, opacity_max,
+                   growth_frames, stable_frames, decay_frames, inv_growth, inv_decay,
+                   scatter_prob, movement_mult, domain, wrap_around):
+        """
+        Fused movement, boundary, lifecycle and smoothing pass over the fleet.
+        Dead slots are skipped; expired parcels are cleared from ``alive`` in
+        place. Returns the sum of r**2 over surviving parcels.
+        """
+        n = x.shape[0]
+        sum_r2 = 0.0
+        edge_margin = 0.1 * domain
+        removal_margin = 0.3 * domain
+        free_margin = 0.5 * domain
+        max_age = growth_frames + stable_frames + decay_frames
+
+        for i in prange(n):
+            if not alive[i]:
+                continue
+            px, py = x[i], y[i]
+            prev_x[i], prev_y[i] = px, py
+            a = age[i] + 1
+            age[i] = a
+
+            xi = px + vx[i] * movement_mult
+            yi = py + vy[i] * movement_mult
+
+            # Boundary handling (see UltraOptimizedCloudParcel._handle_boundaries)
+            if wrap_around:
+                if xi < -edge_margin:
+                    if px > domain * 0.8:
+                        xi = domain + edge_margin
+                elif xi > domain + edge_margin:
+                    if px < domain * 0.2:
+                        xi = -edge_margin
+                if yi < -edge_margin:
+                    if py > domain * 0.8:
+                        yi = domain + edge_margin
+                elif yi > domain + edge_margin:
+                    if py < domain * 0.2:
+                        yi = -edge_margin
+                removal = xi < -removal_margin and yi > domain + removal_margin
+            else:
+                removal = (xi < -free_margin or xi > domain + free_margin or
+                           yi < -free_margin or yi > domain + free_margin)
+            x[i], y[i] = xi, yi
+
+            # Lifecycle phase
+            if a < growth_frames:
+                progress = np.float32(a) * inv_growth
+                opacity_factor = progress
+                size_factor = 0.8 + 0.2 * progress
+            elif a < growth_frames + stable_frames:
+                opacity_factor = 1.0
+                size_factor = 1.0
+                if scatter_prob > 0 and rolls[i] < scatter_prob:
+                    flag_for_split[i] = True
+            else:
+                decay_progress = min(1.0, np.float32(a - growth_frames - stable_frames) * inv_decay)
+                opacity_factor = 1.0 - min(0.5, decay_progress)
+                size_factor = 1.0 - 0.2 * decay_progress
+
+            # Smooth interpolation for size and opacity
+            t = type_id[i]
+            ri = r[i] * 0.95 + r_km_max[t] * size_factor * 2.0 * 0.05
+            op = opacity[i] * 0.95 + max(0.7, opacity_max[t] * opacity_factor) * 0.05
+            if split_fading[i] > 0:
+                split_fading[i] -= 1
+                op *= 0.95
+            r[i] = ri
+            opacity[i] = op
+
+            keep = (not removal) and a < max_age and ri >= 0.15
+            alive[i] = keep
+            if keep:
+                sum_r2 += ri * ri
+
+        return sum_r2
+
+# STEP 1 & 2: NE corner spawn box in metres (DOMAIN_SIZE_M is fixed for the run)
+_SPAWN_X_LO = CFG.DOMAIN_SIZE_M * 0.85    # 85-95% of width (east edge)
+_SPAWN_X_SPAN = CFG.DOMAIN_SIZE_M * 0.10
+_SPAWN_Y_LO = CFG.DOMAIN_SIZE_M * 0.05    # 5-15% of height (north edge)
+_SPAWN_Y_SPAN = CFG.DOMAIN_SIZE_M * 0.10
 
 class UltraOptimizedCloudParcel:
     """Memory-optimized cloud parcel with __slots__ and cached calculations."""
@@ -125,11 +226,11 @@ class UltraOptimizedCloudParcel:
         # Physical properties
         'type', 'r', 'opacity', 'alt',
         # Lifecycle
-        'age', 'max_age', '_lifecycle_cache',
+        'age',
         # State flags
         'flag_for_split', 'split_fading',
         # Cached data
-        '_preset', '_trail', '_last_ellipse_cache', '_shape_cache_key'
+        '_preset', '_trail'
     )
     
     def __init__(self, x: float, y: float, ctype: str):
@@ -139,28 +240,20 @@ class UltraOptimizedCloudParcel:
         
         # Type and preset (cached)
         self.type = ctype
-        self._preset = CloudTypePreset.from_config(ctype)
+        self._preset = _PRESETS[ctype]
         
         # Physical properties
         self.alt = self._preset.alt_km
         self.r = self._preset.r_km_max * 2.0  # Double for visibility
         self.opacity = 1.0
         
-        # STEP 4: Velocity calculation using CFG.CLOUD_DIRECTION (135°)
-        # This gives us NE→SW movement (negative x, positive y)
-        direction_deg = getattr(CFG, 'CLOUD_DIRECTION', 135.0)
-        base_speed = getattr(CFG, 'BASE_WIND_SPEED', 4.0)
+        # NE→SW base velocity (negative x, positive y) with speed jitter
         speed_factor = random.uniform(0.95, 1.05)
-        speed = base_speed * speed_factor
-        
-        # Use cached trigonometry for 135° = NE→SW direction
-        sin_dir, cos_dir = cached_sin_cos(int(direction_deg))
-        self.vx = speed * cos_dir * M_PER_FRAME  # Negative (westward)
-        self.vy = speed * sin_dir * M_PER_FRAME  # Positive (southward)
+        self.vx = _BASE_VX * speed_factor
+        self.vy = _BASE_VY * speed_factor
         
         # Lifecycle
         self.age = 0
-        self._lifecycle_cache = self._build_lifecycle_cache()
         
         # State
         self.flag_for_split = False
@@ -170,44 +263,17 @@ class UltraOptimizedCloudParcel:
         max_trail_length = getattr(CFG, 'POSITION_HISTORY_LENGTH', 15)
         self._trail = OptimizedTrail(max_trail_length)
         
-        # Caching for expensive operations
-        self._last_ellipse_cache = None
-        self._shape_cache_key = None
-        
-        print(f"Created optimized cloud at ({x:.1f}, {y:.1f}) type={ctype} r={self.r:.2f}km vx={self.vx:.2f} vy={self.vy:.2f}")
-    
-    @lru_cache(maxsize=1)
-    def _build_lifecycle_cache(self) -> Dict[str, int]:
-        """Cache lifecycle phase durations."""
-        return {
-            'growth_frames': getattr(CFG, 'CLOUD_GROWTH_FRAMES', 300),
-            'stable_frames': getattr(CFG, 'CLOUD_STABLE_FRAMES', 1800),
-            'decay_frames': getattr(CFG, 'CLOUD_DECAY_FRAMES', 300)
-        }
-    
-    @property
-    def max_age(self) -> int:
-        """Cached max age calculation."""
-        if not hasattr(self, '_cached_max_age'):
-            cache = self._lifecycle_cache
-            self._cached_max_age = (cache['growth_frames'] + 
-                                  cache['stable_frames'] + 
-                                  cache['decay_frames'])
-        return self._cached_max_age
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Created optimized cloud at ({x:.1f}, {y:.1f}) type={ctype} r={self.r:.2f}km vx={self.vx:.2f} vy={self.vy:.2f}")
     
     def _get_lifecycle_factors(self) -> Tuple[float, float]:
-        """Optimized lifecycle factor calculation with caching."""
-        cache = self._lifecycle_cache
-        growth_frames = cache['growth_frames']
-        stable_frames = cache['stable_frames']
-        decay_frames = cache['decay_frames']
-        
-        if self.age < growth_frames:
+        """Optimized lifecycle factor calculation using the module lifecycle constants."""
+        if self.age < LIFECYCLE_GROWTH:
             # Growth phase
-            progress = self.age / growth_frames
+            progress = self.age / LIFECYCLE_GROWTH
             opacity_factor = progress
             size_factor = 0.8 + 0.2 * progress
-        elif self.age < growth_frames + stable_frames:
+        elif self.age < LIFECYCLE_GROWTH + LIFECYCLE_STABLE:
             # Stable phase
             opacity_factor = 1.0
             size_factor = 1.0
@@ -218,7 +284,7 @@ class UltraOptimizedCloudParcel:
                 self.flag_for_split = True
         else:
             # Decay phase
-            decay_progress = (self.age - growth_frames - stable_frames) / decay_frames
+            decay_progress = (self.age - LIFECYCLE_GROWTH - LIFECYCLE_STABLE) / LIFECYCLE_DECAY
             decay_progress = min(1.0, decay_progress)
             opacity_factor = 1.0 - min(0.5, decay_progress)
             size_factor = 1.0 - 0.2 * decay_progress
@@ -259,11 +325,8 @@ class UltraOptimizedCloudParcel:
             self.split_fading -= 1
             self.opacity *= 0.95
         
-        # Invalidate ellipse cache when properties change
-        self._last_ellipse_cache = None
-        
         # Return removal condition
-        return removal or self.age >= self.max_age or self.r < 0.15
+        return removal or self.age >= MAX_AGE or self.r < 0.15
     
     def _handle_boundaries(self) -> bool:
         """
@@ -308,26 +371,12 @@ class UltraOptimizedCloudParcel:
         return (self.x < -removal_margin and self.y > d + removal_margin)
     
     def ellipse(self) -> Tuple[float, float, float, float, float, float, float, str]:
-        """Cached ellipse generation with shape optimization."""
-        # Create cache key
-        cache_key = (round(self.r, 2), self.type, round(self.opacity, 3), self.age // 10)
-        
-        # Return cached result if available
-        if (self._last_ellipse_cache is not None and 
-            self._shape_cache_key == cache_key):
-            return self._last_ellipse_cache
-        
-        # Generate new ellipse with cached shape calculation
-        age_factor = min(1.0, self.age / 100.0)  # Normalize age for caching
-        width, height, rotation, shear = cached_ellipse_shape(self.r, self.type, age_factor)
+        """Ellipse generation with shape optimization."""
+        # r and opacity drift every step, so build the ellipse directly
+        age_factor = min(1.0, self.age / 100.0)  # Grow in over the first 100 frames
+        width, height, rotation, shear = ellipse_shape(self.r, self.type, age_factor)
         
-        ellipse = (self.x, self.y, width, height, rotation, self.opacity, self.alt, self.type)
-        
-        # Cache the result
-        self._last_ellipse_cache = ellipse
-        self._shape_cache_key = cache_key
-        
-        return ellipse
+        return (self.x, self.y, width, height, rotation, self.opacity, self.alt, self.type)
     
     def get_trail_positions(self) -> List[Tuple[float, float]]:
         """Get trail positions efficiently."""
@@ -337,28 +386,362 @@ class UltraOptimizedCloudParcel:
         """Clear trail for memory management."""
         self._trail.clear()
 
-# Alias for backward compatibility
-SimpleCloudParcel = UltraOptimizedCloudParcel
-EnhancedCloudParcel = UltraOptimizedCloudParcel
+class FleetParcel:
+    """
+    Read-only view of one CloudFleet slot, exposing the attributes of
+    UltraOptimizedCloudParcel. Slots move when the fleet compacts, so a view
+    is only valid until the next step.
+    """
+    __slots__ = ('_fleet', '_i')
+    
+    def __init__(self, fleet: 'CloudFleet', i: int):
+        self._fleet = fleet
+        self._i = i
+    
+    x = property(lambda self: float(self._fleet.x[self._i]))
+    y = property(lambda self: float(self._fleet.y[self._i]))
+    prev_x = property(lambda self: float(self._fleet.prev_x[self._i]))
+    prev_y = property(lambda self: float(self._fleet.prev_y[self._i]))
+    vx = property(lambda self: float(self._fleet.vx[self._i]))
+    vy = property(lambda self: float(self._fleet.vy[self._i]))
+    r = property(lambda self: float(self._fleet.r[self._i]))
+    opacity = property(lambda self: float(self._fleet.opacity[self._i]))
+    age = property(lambda self: int(self._fleet.age[self._i]))
+    split_fading = property(lambda self: int(self._fleet.split_fading[self._i]))
+    type = property(lambda self: CLOUD_TYPE_NAMES[self._fleet.type_id[self._i]])
+    alt = property(lambda self: float(_TYPE_ALT_KM[self._fleet.type_id[self._i]]))
+    
+    def ellipse(self) -> Tuple[float, float, float, float, float, float, float, str]:
+        """Ellipse tuple in the UltraOptimizedCloudParcel.ellipse() format."""
+        width, height, rotation, _ = ellipse_shape(self.r, self.type, min(1.0, self.age / 100.0))
+        return (self.x, self.y, width, height, rotation, self.opacity, self.alt, self.type)
+    
+    def get_trail_positions(self) -> List[Tuple[float, float]]:
+        """Trail positions, oldest first."""
+        return [tuple(p) for p in self._fleet.get_trail_positions(self._i).tolist()]
+
+@dataclass
+class CloudFleet:
+    """
+    Structure-of-Arrays storage for every active cloud parcel.
+    Slots [0, n_slots) are in use and alive_mask marks which of them hold
+    live parcels; dead slots are reused by later spawns and only squeezed
+    out by an occasional compact(). The parcel lifecycle of
+    UltraOptimizedCloudParcel.step is applied to all of them at once.
+    """
+    capacity: int
+    # Number of live parcels
+    n_active: int = 0
+    # High-water mark of slots in use; live parcels lie in [0, n_slots)
+    n_slots: int = 0
+    # Steps since the last compaction
+    steps_since_compact: int = 0
+    # Sum of r**2 over live parcels, maintained by step_all and add
+    sum_r2: float = 0.0
+    # Positions kept per parcel in the trail ring buffer
+    trail_len: int = 15
+    x: np.ndarray = field(init=False, repr=False)
+    y: np.ndarray = field(init=False, repr=False)
+    prev_x: np.ndarray = field(init=False, repr=False)
+    prev_y: np.ndarray = field(init=False, repr=False)
+    vx: np.ndarray = field(init=False, repr=False)
+    vy: np.ndarray = field(init=False, repr=False)
+    r: np.ndarray = field(init=False, repr=False)
+    opacity: np.ndarray = field(init=False, repr=False)
+    age: np.ndarray = field(init=False, repr=False)
+    type_id: np.ndarray = field(init=False, repr=False)
+    split_fading: np.ndarray = field(init=False, repr=False)
+    flag_for_split: np.ndarray = field(init=False, repr=False)
+    alive_mask: np.ndarray = field(init=False, repr=False)
+    trail: np.ndarray = field(init=False, repr=False)
+    trail_head: np.ndarray = field(init=False, repr=False)
+    trail_count: np.ndarray = field(init=False, repr=False)
+
+    # float32 is ample for a visual simulation and halves the per-frame sweep
+    _ARRAY_DTYPES = {
+        'x': np.float32, 'y': np.float32, 'prev_x': np.float32, 'prev_y': np.float32,
+        'vx': np.float32, 'vy': np.float32, 'r': np.float32, 'opacity': np.float32,
+        'age': np.int32, 'type_id': np.uint8, 'split_fading': np.int32,
+        'flag_for_split': np.bool_, 'alive_mask': np.bool_,
+        # Trail ring buffer: (capacity, trail_len, 2) positions, next write index, fill count
+        'trail': np.float32, 'trail_head': np.int32, 'trail_count': np.int32,
+    }
+    
+    # Compact once fewer than this fraction of used slots are live, or at
+    # least every COMPACT_INTERVAL steps so the used range stays dense
+    COMPACT_LIVE_FRACTION = 0.5
+    COMPACT_INTERVAL = 120
+
+    def __post_init__(self):
+        self._allocate(self.capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        """Allocate (or grow) every per-parcel array to the given capacity."""
+        for name, dtype in self._ARRAY_DTYPES.items():
+            self._resize(name, capacity, dtype)
+        self.capacity = capacity
+
+    def _resize(self, name: str, capacity: int, dtype) -> None:
+        shape = (capacity, self.trail_len, 2) if name == 'trail' else capacity
+        new = np.zeros(shape, dtype=dtype)
+        old = getattr(self, name, None)
+        if old is not None:
+            new[:self.n_slots] = old[:self.n_slots]
+        setattr(self, name, new)
+
+    def __len__(self) -> int:
+        return self.n_active
+
+    def __iter__(self):
+        """Iterate live parcels as FleetParcel views, in slot order."""
+        return (FleetParcel(self, int(i)) for i in self.live_slots())
+
+    def __getitem__(self, key):
+        """FleetParcel view (or list of views for a slice) indexed over live parcels."""
+        live = self.live_slots()
+        if isinstance(key, slice):
+            return [FleetParcel(self, int(i)) for i in live[key]]
+        return FleetParcel(self, int(live[key]))
+
+    def live_slots(self) -> np.ndarray:
+        """Indices of the slots holding live parcels."""
+        return np.flatnonzero(self.alive_mask[:self.n_slots])
+
+    def _claim_slots(self, k: int) -> np.ndarray:
+        """Reserve ``k`` slots, reusing dead ones before extending the used range."""
+        free = np.flatnonzero(~self.alive_mask[:self.n_slots])[:k]
+        extra = k - free.size
+        if extra:
+            capacity = max(self.capacity, 1)  # Doubling must start from a non-empty fleet
+            while self.n_slots + extra > capacity:
+                capacity *= 2
+            if capacity != self.capacity:
+                self._allocate(capacity)
+            free = np.concatenate((free, np.arange(self.n_slots, self.n_slots + extra)))
+            self.n_slots += extra
+        self.alive_mask[free] = True
+        self.n_active += k
+        return free
+
+    def add(self, x: float, y: float, type_id: int, vx: float, vy: float,
+            r: Optional[float] = None, age: int = 0) -> int:
+        """Write a new parcel into a free slot and return its index."""
+        i = int(self._claim_slots(1)[0])
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.vx[i], self.vy[i] = vx, vy
+        self.r[i] = _TYPE_R_KM_MAX[type_id] * 2.0 if r is None else r  # Double for visibility
+        self.opacity[i] = 1.0
+        self.age[i] = age
+        self.type_id[i] = type_id
+        self.split_fading[i] = 0
+        self.flag_for_split[i] = False
+        self.trail_head[i] = self.trail_count[i] = 0
+        self.sum_r2 += float(self.r[i]) ** 2
+        return i
+
+    def add_batch(self, x: np.ndarray, y: np.ndarray, type_id: np.ndarray,
+                  vx: np.ndarray, vy: np.ndarray, r: np.ndarray, age: int = 0) -> np.ndarray:
+        """Write ``len(x)`` new parcels into free slots and return their indices."""
+        s = self._claim_slots(len(x))
+        self.x[s] = self.prev_x[s] = x
+        self.y[s] = self.prev_y[s] = y
+        self.vx[s], self.vy[s] = vx, vy
+        self.r[s] = r
+        self.opacity[s] = 1.0
+        self.age[s] = age
+        self.type_id[s] = type_id
+        self.split_fading[s] = 0
+        self.flag_for_split[s] = False
+        self.trail_head[s] = self.trail_count[s] = 0
+        self.sum_r2 += float(np.dot(self.r[s], self.r[s]))
+        return s
+
+    def step_all(self, dt: float, rng: np.random.Generator) -> int:
+        """Advance every live parcel one frame and return how many expired."""
+        n = self.n_slots
+        if self.n_active == 0:
+            return 0
+
+        movement_mult = getattr(CFG, 'MOVEMENT_MULTIPLIER', 1.0)
+        scatter_prob = getattr(CFG, 'SCATTER_PROBABILITY', 0.0)
+        rolls = rng.random(n, dtype=np.float32) if scatter_prob > 0 else _NO_ROLLS
+
+        self._record_trail(n)
+
+        if NUMBA_AVAILABLE:
+            self.sum_r2 = step_fleet(
+                self.x[:n], self.y[:n], self.prev_x[:n], self.prev_y[:n],
+                self.vx[:n], self.vy[:n], self.r[:n], self.opacity[:n],
+                self.age[:n], self.type_id[:n], self.split_fading[:n],
+                self.flag_for_split[:n], self.alive_mask[:n], rolls,
+                _TYPE_R_KM_MAX, _TYPE_OPACITY_MAX,
+                LIFECYCLE_GROWTH, LIFECYCLE_STABLE, LIFECYCLE_DECAY, _INV_GROWTH, _INV_DECAY,
+                np.float32(scatter_prob), np.float32(movement_mult), np.float32(CFG.DOMAIN_SIZE_M),
+                bool(getattr(CFG, 'CLOUD_WRAP_AROUND', True)))
+        else:
+            self.sum_r2 = self._step_numpy(n, movement_mult, scatter_prob, rolls)
+
+        n_before = self.n_active
+        self.n_active = int(np.count_nonzero(self.alive_mask[:n]))
+
+        # Expired slots stay in place until fragmentation makes a repack worthwhile
+        self.steps_since_compact += 1
+        if (self.n_active < self.COMPACT_LIVE_FRACTION * n or
+                self.steps_since_compact >= self.COMPACT_INTERVAL):
+            self.compact()
+        return n_before - self.n_active
+
+    def _step_numpy(self, n: int, movement_mult: float, scatter_prob: float,
+                    rolls: np.ndarray) -> float:
+        """
+        NumPy fallback for step_fleet. Dead slots are advanced too but stay
+        dead; returns the surviving sum of r**2.
+        """
+        x, y = self.x[:n], self.y[:n]
+        age, r, opacity = self.age[:n], self.r[:n], self.opacity[:n]
+        type_id = self.type_id[:n]
+
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        age += 1
+
+        px, py = self.prev_x[:n], self.prev_y[:n]
+        x += self.vx[:n] * np.float32(movement_mult)
+        y += self.vy[:n] * np.float32(movement_mult)
+
+        # Branchless boundary handling (see UltraOptimizedCloudParcel._handle_boundaries)
+        d = CFG.DOMAIN_SIZE_M
+        if getattr(CFG, 'CLOUD_WRAP_AROUND', True):
+            edge = 0.1 * d
+            wrap_east = (x < -edge) & (px > 0.8 * d)
+            wrap_west = (x > d + edge) & (px < 0.2 * d)
+            wrap_south = (y < -edge) & (py > 0.8 * d)
+            wrap_north = (y > d + edge) & (py < 0.2 * d)
+            x[:] = np.where(wrap_east, d + edge, np.where(wrap_west, -edge, x))
+            y[:] = np.where(wrap_south, d + edge, np.where(wrap_north, -edge, y))
+            removal = (x < -0.3 * d) & (y > 1.3 * d)
+        else:
+            removal = (np.abs(x - 0.5 * d) > d) | (np.abs(y - 0.5 * d) > d)
+
+        # Branchless lifecycle factors: t_growth saturates at 1 after growth,
+        # t_decay stays 0 until decay, so each phase reduces to its own formula
+        age_f = age.astype(np.float32)
+        t_growth = np.minimum(age_f * _INV_GROWTH, 1.0)
+        t_decay = np.clip((age_f - LIFECYCLE_GROWTH - LIFECYCLE_STABLE) * _INV_DECAY, 0.0, 1.0)
+        opacity_factor = t_growth - np.minimum(0.5, t_decay)
+        size_factor = 0.8 + 0.2 * t_growth - 0.2 * t_decay
+
+        if scatter_prob > 0:
+            stable = (age >= LIFECYCLE_GROWTH) & (age < LIFECYCLE_GROWTH + LIFECYCLE_STABLE)
+            self.flag_for_split[:n] |= stable & (rolls < scatter_prob)
+
+        # Smooth interpolation for size and opacity
+        target_size = _TYPE_R_KM_MAX[type_id] * size_factor * 2.0
+        target_opacity = np.maximum(0.7, _TYPE_OPACITY_MAX[type_id] * opacity_factor)
+        r *= 0.95
+        r += target_size * 0.05
+        opacity *= 0.95
+        opacity += target_opacity * 0.05
+
+        # Handle split fading
+        fading = self.split_fading[:n] > 0
+        self.split_fading[:n][fading] -= 1
+        opacity[fading] *= 0.95
+
+        alive = self.alive_mask[:n]
+        alive &= ~removal & (age < MAX_AGE) & (r >= 0.15)
+        return float(np.dot(r, np.where(alive, r, 0.0)))
+
+    def _record_trail(self, n: int) -> None:
+        """Push the current (pre-move) positions into each parcel's trail ring."""
+        if self.trail_len == 0:
+            return
+        head = self.trail_head[:n]
+        slots = np.arange(n)
+        self.trail[slots, head, 0] = self.x[:n]
+        self.trail[slots, head, 1] = self.y[:n]
+        head += 1
+        head[head == self.trail_len] = 0
+        count = self.trail_count[:n]
+        count[count < self.trail_len] += 1
+
+    def get_trail_positions(self, i: int) -> np.ndarray:
+        """Trail of slot ``i`` as a (count, 2) array, oldest position first."""
+        if self.trail_len == 0:
+            return np.empty((0, 2), dtype=np.float32)
+        count = int(self.trail_count[i])
+        start = int(self.trail_head[i]) - count
+        return self.trail[i, (start + np.arange(count)) % self.trail_len]
+
+    def clear_trail(self, i: int) -> None:
+        """Forget the trail of slot ``i``."""
+        self.trail_count[i] = 0
+
+    def compact(self) -> None:
+        """Pack the live parcels into slots [0, n_active), preserving their order."""
+        n = self.n_slots
+        alive = self.alive_mask[:n].copy()
+        if self.n_active != n:
+            for name in self._ARRAY_DTYPES:
+                arr = getattr(self, name)
+                arr[:self.n_active] = np.compress(alive, arr[:n], axis=0)
+            self.alive_mask[self.n_active:n] = False
+            self.n_slots = self.n_active
+        self.steps_since_compact = 0
+
+    def ellipses(self) -> np.ndarray:
+        """
+        Visible parcels as an (M, 8) array with columns
+        x, y, width, height, rotation, opacity, alt_km, type_id.
+        CLOUD_TYPE_NAMES[int(row[7])] recovers the cloud type name.
+        """
+        n = self.n_slots
+        visible = self.alive_mask[:n] & (self.opacity[:n] > 0.01)
+        type_id = self.type_id[:n][visible]
+        diameter = self.r[:n][visible] * 2000.0  # km -> m with visibility multiplier
+        diameter *= np.minimum(1.0, self.age[:n][visible].astype(np.float32) * 0.01)
+
+        out = np.empty((type_id.shape[0], 8), dtype=np.float32)
+        out[:, 0] = self.x[:n][visible]
+        out[:, 1] = self.y[:n][visible]
+        out[:, 2] = diameter * np.take(_TYPE_WIDTH_FACTOR, type_id)
+        out[:, 3] = diameter * np.take(_TYPE_HEIGHT_FACTOR, type_id)
+        out[:, 4] = 0.0
+        out[:, 5] = self.opacity[:n][visible]
+        out[:, 6] = np.take(_TYPE_ALT_KM, type_id)
+        out[:, 7] = type_id
+        return out
 
 class OptimizedWeatherSystem:
     """Weather system with optimized parcel management and NE→SW spawning."""
     __slots__ = (
-        'parcels', 'sim_time', 'time_since_last_spawn',
-        '_cloud_type_cache', '_spawn_position_cache',
-        '_trajectory_cache', '_coverage_cache', '_rng'
+        'fleet', 'sim_time', 'time_since_last_spawn',
+        '_ctype_names', '_ctype_cum', '_spawn_position_cache',
+        '_trajectory_cache', '_coverage_cache', '_rng',
+        '_rand_pool', '_rand_next'
     )
     
+    # Headroom over MAX_PARCELS for fragments created by cloud scattering
+    FLEET_CAPACITY_FACTOR = 4
+    
+    # Uniform draws per pool row; each spawn, split parent or child consumes one row
+    RAND_POOL_WIDTH = 4
+    MAX_FRAGMENTS = 3
+    MAX_SPAWNS_PER_STEP = 2
+    
     def __init__(self, seed: int = 0):
-        self.parcels: List[UltraOptimizedCloudParcel] = []
+        capacity = getattr(CFG, 'MAX_PARCELS', 6) * self.FLEET_CAPACITY_FACTOR
+        self.fleet = CloudFleet(capacity, trail_len=getattr(CFG, 'POSITION_HISTORY_LENGTH', 15))
         self.sim_time = 0.0
         self.time_since_last_spawn = 0.0
         
-        # Initialize random generator
+        # Initialize random generator and the per-step pool of uniform draws
         self._rng = np.random.default_rng(seed)
+        self._refill_rand_pool(1)
         
         # Caching for expensive operations
-        self._cloud_type_cache = self._build_cloud_type_cache()
+        self._build_cloud_type_cache()
         self._spawn_position_cache = {}
         self._trajectory_cache = {'speed': None, 'direction': None, 'confidence': 0, 'frame': -1}
         self._coverage_cache = {'value': 0.0, 'frame': -1}
@@ -368,25 +751,47 @@ class OptimizedWeatherSystem:
         # Force spawn initial cloud in NE corner
         self._spawn_center_cloud()
     
-    @lru_cache(maxsize=1)
-    def _build_cloud_type_cache(self) -> Tuple[List[str], List[float]]:
-        """Cache cloud type selection data."""
-        cloud_types = list(CFG.CLOUD_TYPE_WEIGHTS.keys())
-        weights = list(CFG.CLOUD_TYPE_WEIGHTS.values())
-        return cloud_types, weights
+    @property
+    def parcels(self) -> CloudFleet:
+        """
+        The parcel fleet. Supports len(), iteration, indexing and slicing,
+        yielding read-only FleetParcel views of the live parcels.
+        """
+        return self.fleet
+    
+    def _build_cloud_type_cache(self) -> None:
+        """Precompute the cumulative cloud type distribution for searchsorted sampling."""
+        weights = np.array(list(CFG.CLOUD_TYPE_WEIGHTS.values()), dtype=np.float64)
+        self._ctype_names = np.array(list(CFG.CLOUD_TYPE_WEIGHTS.keys()))
+        self._ctype_cum = np.cumsum(weights) / weights.sum()
+        self._ctype_cum[-1] = 1.0  # Guard against rounding so every draw lands in range
+    
+    def _refill_rand_pool(self, rows: int) -> None:
+        """Draw a batch of uniform numbers for this step's spawns and splits."""
+        self._rand_pool = self._rng.random(size=(rows, self.RAND_POOL_WIDTH), dtype=np.float32)
+        self._rand_next = 0
+    
+    def _take_rand_rows(self, k: int) -> np.ndarray:
+        """Consume ``k`` rows of the random pool, redrawing if too few are left."""
+        if self._rand_next + k > len(self._rand_pool):
+            self._refill_rand_pool(max(k, self.MAX_SPAWNS_PER_STEP))
+        rows = self._rand_pool[self._rand_next:self._rand_next + k]
+        self._rand_next += k
+        return rows
+    
+    def _next_rand_row(self) -> np.ndarray:
+        """Consume one row of the random pool."""
+        return self._take_rand_rows(1)[0]
+    
+    def _add_parcel(self, x: float, y: float, ctype: str, jitter: float) -> int:
+        """Write a new parcel into the fleet moving at the base velocity scaled by 0.95-1.05."""
+        speed_factor = 0.95 + 0.1 * float(jitter)
+        return self.fleet.add(x, y, CLOUD_TYPE_INDEX[ctype],
+                              _BASE_VX * speed_factor, _BASE_VY * speed_factor)
     
     def _spawn_center_cloud(self) -> None:
         """Spawn optimized cloud in NE corner."""
-        # Use the fixed spawn position helper
-        spawn_x, spawn_y = _get_spawn_position_base(self._rng)
-        
-        # Use cached cloud type selection
-        cloud_types, weights = self._cloud_type_cache
-        ctype = self._rng.choice(cloud_types, p=np.array(weights)/np.sum(weights))
-        
-        new_cloud = UltraOptimizedCloudParcel(spawn_x, spawn_y, ctype)
-        self.parcels.append(new_cloud)
-        print(f"Spawned optimized center cloud: {ctype} at ({spawn_x:.1f}, {spawn_y:.1f}) - NE corner")
+        self._spawn(label="center")
     
     def step(self, dt: Optional[float] = None, t: Optional[float] = None, t_s: Optional[float] = None) -> None:
         """Optimized step with batch processing and caching."""
@@ -405,21 +810,26 @@ class OptimizedWeatherSystem:
         self.time_since_last_spawn += dt
         
         # Ensure minimum cloud count
-        if not self.parcels:
+        if not self.fleet.n_active:
+            self._refill_rand_pool(1)
             self._spawn_center_cloud()
             self.time_since_last_spawn = 0.0
             return
         
-        # Batch update all parcels with list comprehension
-        active_parcels = [p for p in self.parcels if not p.step(dt, self, self.sim_time)]
+        # Vectorized update of the whole fleet
+        removed_count = self.fleet.step_all(dt, self._rng)
         
         # Count removed parcels for debugging
-        removed_count = len(self.parcels) - len(active_parcels)
-        if removed_count > 0:
-            print(f"Removed {removed_count} expired cloud parcels")
+        if removed_count > 0 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Removed {removed_count} expired cloud parcels")
+        
+        # One batched draw covers every split parent, its fragments and new spawns
+        n = self.fleet.n_slots
+        n_split = int(np.count_nonzero(self.fleet.flag_for_split[:n] & self.fleet.alive_mask[:n]))
+        self._refill_rand_pool(n_split * (1 + self.MAX_FRAGMENTS) + self.MAX_SPAWNS_PER_STEP)
         
         # Handle cloud scattering with optimized splitting
-        self.parcels = self._handle_cloud_scattering(active_parcels)
+        self._handle_cloud_scattering()
         
         # Optimized spawning logic
         self._handle_spawning()
@@ -428,52 +838,41 @@ class OptimizedWeatherSystem:
         self._trajectory_cache['frame'] = -1
         self._coverage_cache['frame'] = -1
     
-    def _handle_cloud_scattering(self, parcels: List[UltraOptimizedCloudParcel]) -> List[UltraOptimizedCloudParcel]:
-        """Optimized cloud scattering with list comprehensions."""
-        new_parcels = []
-        
-        for parcel in parcels:
-            if parcel.flag_for_split:
-                # Generate fragments efficiently
-                n_fragments = random.randint(2, 3)
-                print(f"Cloud scattering: {n_fragments} fragments from ({parcel.x:.1f}, {parcel.y:.1f})")
-                
-                # Create children with list comprehension
-                children = [
-                    self._create_child_parcel(parcel)
-                    for _ in range(n_fragments)
-                ]
-                new_parcels.extend(children)
-                
-                # Reset parent state
-                parcel.flag_for_split = False
-                parcel.split_fading = 60
-                new_parcels.append(parcel)
-            else:
-                new_parcels.append(parcel)
-        
-        return new_parcels
-    
-    def _create_child_parcel(self, parent: UltraOptimizedCloudParcel) -> UltraOptimizedCloudParcel:
-        """Create optimized child parcel from parent."""
-        # Offset position slightly
-        offset_x = parent.x + random.uniform(-0.5, 0.5) * 1000
-        offset_y = parent.y + random.uniform(-0.5, 0.5) * 1000
-        
-        child = UltraOptimizedCloudParcel(offset_x, offset_y, parent.type)
-        
-        # Inherit properties efficiently
-        child.vx, child.vy = parent.vx, parent.vy
-        child.r = parent.r * random.uniform(0.8, 0.9)
-        child.age = parent._lifecycle_cache['growth_frames']  # Start in stable phase
+    def _handle_cloud_scattering(self) -> None:
+        """Split every parcel flagged during the fleet step into fragments in one batch."""
+        fleet = self.fleet
+        n = fleet.n_slots
+        split_idx = np.flatnonzero(fleet.flag_for_split[:n] & fleet.alive_mask[:n])
+        if not split_idx.size:
+            return
         
-        return child
+        # Pool row per parent: fragment count (2 or 3)
+        n_fragments = 2 + (self._take_rand_rows(split_idx.size)[:, 0] * 2).astype(np.intp)
+        parents = np.repeat(split_idx, n_fragments)
+        
+        # Pool row per child: x offset, y offset, radius jitter
+        u = self._take_rand_rows(parents.size)
+        
+        # Offset position slightly, inherit velocity and a slightly smaller
+        # radius; children start in the stable phase
+        fleet.add_batch(fleet.x[parents] + (u[:, 0] - 0.5) * 1000,
+                        fleet.y[parents] + (u[:, 1] - 0.5) * 1000,
+                        fleet.type_id[parents], fleet.vx[parents], fleet.vy[parents],
+                        fleet.r[parents] * (0.8 + 0.1 * u[:, 2]), age=LIFECYCLE_GROWTH)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Cloud scattering: {parents.size} fragments from {split_idx.size} parcels")
+        
+        # Reset parent state
+        fleet.flag_for_split[split_idx] = False
+        fleet.split_fading[split_idx] = 60
     
     def _handle_spawning(self) -> None:
         """Optimized spawning logic with NE corner placement."""
+        n_active = self.fleet.n_active
+        
         # Single cloud mode check
         if getattr(CFG, 'SINGLE_CLOUD_MODE', False):
-            if len(self.parcels) == 0:
+            if n_active == 0:
                 self._spawn()
                 self.time_since_last_spawn = 0.0
             return
@@ -485,31 +884,36 @@ class OptimizedWeatherSystem:
         
         can_spawn = self.time_since_last_spawn > min_spawn_interval
         should_spawn = (can_spawn and 
-                       len(self.parcels) < max_parcels and 
-                       (random.random() < spawn_probability or len(self.parcels) == 0))
+                       n_active < max_parcels and 
+                       (random.random() < spawn_probability or n_active == 0))
         
         if should_spawn:
             self._spawn()
             self.time_since_last_spawn = 0.0
         
         # Force spawn if needed
-        if (len(self.parcels) == 0 and 
+        if (self.fleet.n_active == 0 and 
             getattr(CFG, 'FORCE_INITIAL_CLOUD', False)):
             self._spawn()
             self.time_since_last_spawn = 0.0
     
-    def _spawn(self) -> None:
-        """Optimized spawning with NE corner placement."""
-        # Use the fixed spawn position helper
-        spawn_x, spawn_y = _get_spawn_position_base(self._rng)
+    def _spawn(self, label: str = "optimized") -> None:
+        """Optimized spawning with NE corner placement; ``label`` tags the debug log."""
+        # Pool row: x, y, cloud type, speed jitter
+        u = self._next_rand_row()
+        
+        # Place the cloud in the NE corner box so that, with CLOUD_DIRECTION = 135°,
+        # it immediately drifts toward the South-West
+        spawn_x = _SPAWN_X_LO + _SPAWN_X_SPAN * float(u[0])
+        spawn_y = _SPAWN_Y_LO + _SPAWN_Y_SPAN * float(u[1])
         
         # Use cached cloud type selection
-        cloud_types, weights = self._cloud_type_cache
-        ctype = self._rng.choice(cloud_types, p=np.array(weights)/np.sum(weights))
+        idx = np.searchsorted(self._ctype_cum, u[2], side='right')
+        ctype = str(self._ctype_names[idx])
         
-        new_cloud = UltraOptimizedCloudParcel(spawn_x, spawn_y, ctype)
-        self.parcels.append(new_cloud)
-        print(f"Spawned optimized {ctype} cloud at ({spawn_x:.1f}, {spawn_y:.1f}) - NE corner")
+        self._add_parcel(spawn_x, spawn_y, ctype, u[3])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Spawned {label} {ctype} cloud at ({spawn_x:.1f}, {spawn_y:.1f}) - NE corner")
     
     def get_avg_trajectory(self) -> Tuple[Optional[float], Optional[float], float]:
         """Cached trajectory calculation."""
@@ -520,23 +924,19 @@ class OptimizedWeatherSystem:
         if cache['frame'] == current_frame and cache['speed'] is not None:
             return cache['speed'], cache['direction'], cache['confidence']
         
-        if not self.parcels:
+        if not self.fleet.n_active:
             result = None, None, 0
         else:
-            # Vectorized calculation using list comprehensions
-            velocities = [(p.vx, p.vy) for p in self.parcels]
+            # NumPy reductions over the live slots of the fleet velocity arrays
+            live = self.fleet.live_slots()
+            avg_vx = float(self.fleet.vx[live].mean())
+            avg_vy = float(self.fleet.vy[live].mean())
             
-            if velocities:
-                avg_vx = sum(vx for vx, vy in velocities) / len(velocities)
-                avg_vy = sum(vy for vx, vy in velocities) / len(velocities)
-                
-                speed = math.sqrt(avg_vx**2 + avg_vy**2)
-                direction = math.degrees(math.atan2(avg_vy, avg_vx)) % 360
-                speed_kmh = speed * 3.6 / M_PER_FRAME
-                
-                result = speed_kmh, direction, 0.9
-            else:
-                result = None, None, 0
+            speed = math.hypot(avg_vx, avg_vy)
+            direction = math.degrees(math.atan2(avg_vy, avg_vx)) % 360
+            speed_kmh = speed * 3.6 / M_PER_FRAME
+            
+            result = speed_kmh, direction, 0.9
         
         # Cache the result
         cache.update({
@@ -557,11 +957,11 @@ class OptimizedWeatherSystem:
         if cache['frame'] == current_frame:
             return cache['value']
         
-        if not self.parcels:
+        if not self.fleet.n_active:
             coverage = 0.0
         else:
-            # Optimized calculation with list comprehension
-            total_area = sum(math.pi * (p.r ** 2) for p in self.parcels)
+            # sum(r**2) is accumulated by the fleet step, no extra array pass
+            total_area = math.pi * self.fleet.sum_r2
             domain_area = CFG.AREA_SIZE_KM * CFG.AREA_SIZE_KM
             coverage = min(100, (total_area / domain_area) * 100 * 5)
         
@@ -570,14 +970,32 @@ class OptimizedWeatherSystem:
         return coverage
 
 # Optimized ellipse collection with caching
-def collect_visible_ellipses(parcels: List[UltraOptimizedCloudParcel]) -> List[Tuple]:
-    """Optimized ellipse collection using list comprehension."""
+def collect_visible_ellipses(parcels):
+    """
+    Optimized ellipse collection. A CloudFleet yields the (M, 8) array from
+    CloudFleet.ellipses(); a list of parcels yields a list of ellipse tuples.
+    """
+    if isinstance(parcels, CloudFleet):
+        return parcels.ellipses()
     # Single list comprehension instead of loop
     return [parcel.ellipse() for parcel in parcels if parcel.opacity > 0.01]
 
 # Advanced ellipse processing functions
-def batch_process_ellipses(ellipses: List[Tuple], operation: str) -> List[Tuple]:
-    """Batch process ellipses for various operations."""
+def batch_process_ellipses(ellipses: Union[np.ndarray, List[Tuple]],
+                           operation: str) -> Union[np.ndarray, List[Tuple]]:
+    """
+    Batch process ellipses for various operations. Accepts either format
+    returned by collect_visible_ellipses and returns the same format.
+    """
+    if isinstance(ellipses, np.ndarray):
+        if operation == "filter_visible":
+            return ellipses[ellipses[:, 5] > 0.01]
+        elif operation == "sort_by_size":
+            return ellipses[np.argsort(-(ellipses[:, 2] * ellipses[:, 3]), kind='stable')]
+        elif operation == "sort_by_altitude":
+            return ellipses[np.argsort(-ellipses[:, 6], kind='stable')]
+        return ellipses
+    
     if operation == "filter_visible":
         return [e for e in ellipses if e[5] > 0.01]  # opacity > 0.01
     elif operation == "sort_by_size":
@@ -587,59 +1005,68 @@ def batch_process_ellipses(ellipses: List[Tuple], operation: str) -> List[Tuple]
     else:
         return ellipses
 
-def interpolate_ellipses(ellipses1: List[Tuple], ellipses2: List[Tuple], t: float) -> List[Tuple]:
-    """Optimized ellipse interpolation using list comprehensions and zip."""
-    if not ellipses1 and not ellipses2:
-        return []
-    
-    if not ellipses1:
-        # Fade in ellipses2
-        return [(e[0], e[1], e[2], e[3], e[4], e[5] * t, e[6], e[7]) 
-                for e in ellipses2]
-    
-    if not ellipses2:
-        # Fade out ellipses1
-        return [(e[0], e[1], e[2], e[3], e[4], e[5] * (1-t), e[6], e[7]) 
-                for e in ellipses1]
-    
-    # Interpolate matching ellipses
-    max_len = max(len(ellipses1), len(ellipses2))
-    result = []
-    
-    for i in range(max_len):
-        if i < len(ellipses1) and i < len(ellipses2):
-            e1, e2 = ellipses1[i], ellipses2[i]
-            # Linear interpolation for all parameters
-            interpolated = tuple(
-                e1[j] * (1-t) + e2[j] * t if isinstance(e1[j], (int, float)) else e1[j]
-                for j in range(len(e1))
-            )
-            result.append(interpolated)
-        elif i < len(ellipses1):
-            # Fade out ellipse1
-            e1 = ellipses1[i]
-            faded = tuple(
-                e1[j] * (1-t) if j == 5 else e1[j]  # Only fade opacity
-                for j in range(len(e1))
-            )
-            result.append(faded)
-        else:
-            # Fade in ellipse2
-            e2 = ellipses2[i]
-            faded = tuple(
-                e2[j] * t if j == 5 else e2[j]  # Only fade opacity
-                for j in range(len(e2))
-            )
-            result.append(faded)
+def interpolate_ellipses(ellipses1: Union[np.ndarray, List[Tuple]],
+                         ellipses2: Union[np.ndarray, List[Tuple]],
+                         t: float) -> Union[np.ndarray, List[Tuple]]:
+    """
+    Interpolate two ellipse sets in either collect_visible_ellipses format.
+    (M, 8) arrays from CloudFleet.ellipses() give an array; lists of ellipse
+    tuples give a list. Mixed input is interpolated as arrays, with the tuple
+    side converted by _ellipse_array (type names mapped via CLOUD_TYPE_INDEX).
+    Matching rows blend their numeric fields and keep the type from
+    ellipses1; unmatched rows keep their geometry and fade out (ellipses1)
+    or in (ellipses2).
+    """
+    if not isinstance(ellipses1, np.ndarray) and not isinstance(ellipses2, np.ndarray):
+        return _interpolate_ellipse_tuples(ellipses1, ellipses2, t)
+    
+    e1 = _ellipse_array(ellipses1)
+    e2 = _ellipse_array(ellipses2)
+    m = min(len(e1), len(e2))
+    
+    out = np.empty((max(len(e1), len(e2)), 8), dtype=np.float32)
+    out[:m, :7] = e1[:m, :7] * (1 - t) + e2[:m, :7] * t
+    out[:m, 7] = e1[:m, 7]
+    
+    if len(e1) > m:
+        out[m:] = e1[m:]
+        out[m:, 5] *= (1 - t)  # Fade out ellipse1 tail
+    elif len(e2) > m:
+        out[m:] = e2[m:]
+        out[m:, 5] *= t  # Fade in ellipse2 tail
+    
+    return out
+
+def _ellipse_array(ellipses: Union[np.ndarray, List[Tuple]]) -> np.ndarray:
+    """(M, 8) float32 ellipse array; tuple type names become CLOUD_TYPE_INDEX ids."""
+    if isinstance(ellipses, np.ndarray):
+        return np.asarray(ellipses, dtype=np.float32).reshape(-1, 8)
+    out = np.empty((len(ellipses), 8), dtype=np.float32)
+    for row, e in zip(out, ellipses):
+        row[:7] = e[:7]
+        row[7] = CLOUD_TYPE_INDEX[e[7]] if isinstance(e[7], str) else e[7]
+    return out
+
+def _interpolate_ellipse_tuples(ellipses1: List[Tuple], ellipses2: List[Tuple], t: float) -> List[Tuple]:
+    """Tuple path of interpolate_ellipses for parcel lists (type name in field 7)."""
+    m = min(len(ellipses1), len(ellipses2))
+    
+    # Linear interpolation for all numeric parameters
+    result = [
+        tuple(a * (1 - t) + b * t if isinstance(a, (int, float)) else a for a, b in zip(e1, e2))
+        for e1, e2 in zip(ellipses1, ellipses2)
+    ]
     
+    # Only fade opacity of the unmatched tail
+    result.extend((*e[:5], e[5] * (1 - t), *e[6:]) for e in ellipses1[m:])
+    result.extend((*e[:5], e[5] * t, *e[6:]) for e in ellipses2[m:])
     return result
 
 def generate_ellipses_for_type(cloud_type: str, count: int, 
                               base_position: Tuple[float, float],
                               size_range: Tuple[float, float]) -> List[Tuple]:
-    """Cached ellipse generation for specific cloud types."""
-    # Use cached shape calculations
-    preset = CloudTypePreset.from_config(cloud_type)
+    """Ellipse generation for specific cloud types."""
+    preset = _PRESETS[cloud_type]
     
     ellipses = []
     for i in range(count):
@@ -647,9 +1074,8 @@ def generate_ellipses_for_type(cloud_type: str, count: int,
         x = base_position[0] + random.uniform(-size_range[0]/4, size_range[0]/4)
         y = base_position[1] + random.uniform(-size_range[1]/4, size_range[1]/4)
         
-        # Use cached shape calculation
         size = random.uniform(size_range[0], size_range[1])
-        width, height, rotation, _ = cached_ellipse_shape(size/2000, cloud_type, 1.0)
+        width, height, rotation, _ = ellipse_shape(size/2000, cloud_type, 1.0)
         
         ellipse = (x, y, width, height, rotation, preset.opacity_max, preset.alt_km, cloud_type)
         ellipses.append(ellipse)
@@ -337,13 +337,10 @@ class OptimizedWeatherSystem:
         """Optimized cloud spawning."""
         # Import CloudParcel here to avoid circular imports
         try:
-            from cloud_simulation import UltraOptimizedCloudParcel as EnhancedCloudParcel
+            from cloud_simulation import UltraOptimizedCloudParcel
         except ImportError:
-            try:
-                from cloud_simulation import EnhancedCloudParcel
-            except ImportError:
-                print("Warning: EnhancedCloudParcel not available, cloud spawning disabled")
-                return
+            print("Warning: UltraOptimizedCloudParcel not available, cloud spawning disabled")
+            return
         
         # Fast wind direction lookup
         try:
@@ -388,14 +385,14 @@ class OptimizedWeatherSystem:
         # FIXED: Create new cloud parcel with proper constructor
         try:
             # Try with cloud type parameter first
-            new_cloud = EnhancedCloudParcel(spawn_x, spawn_y, ctype)
+            new_cloud = UltraOptimizedCloudParcel(spawn_x, spawn_y, ctype)
         except TypeError:
             try:
                 # Fallback to wind parameter if that's what the class expects
-                new_cloud = EnhancedCloudParcel(spawn_x, spawn_y, self.wind, ctype)
+                new_cloud = UltraOptimizedCloudParcel(spawn_x, spawn_y, self.wind, ctype)
             except TypeError:
                 # Final fallback to minimal parameters
-                new_cloud = EnhancedCloudParcel(spawn_x, spawn_y, ctype)
+                new_cloud = UltraOptimizedCloudParcel(spawn_x, spawn_y, ctype)
         
         self.parcels.append(new_cloud)
         print(f"Spawned {ctype} cloud at ({spawn_x:.1f}, {spawn_y:.1f})")
@@ -446,16 +443,13 @@ class OptimizedWeatherSystem:
                     
                     for _ in range(n):
                         try:
-                            from cloud_simulation import UltraOptimizedCloudParcel as EnhancedCloudParcel
+                            from cloud_simulation import UltraOptimizedCloudParcel
                         except ImportError:
-                            try:
-                                from cloud_simulation import EnhancedCloudParcel
-                            except ImportError:
-                                break
+                            break
                         
                         try:
                             # Try different constructor patterns
-                            child = EnhancedCloudParcel(
+                            child = UltraOptimizedCloudParcel(
                                 p.x + random.uniform(-500, 500),
                                 p.y + random.uniform(-500, 500),
                                 p.type)